@@ -7,22 +7,32 @@ Dockerfile, etc.) are created exactly as in the original.
 """
 
 import os
+import re
+import json
+import math
 import time
+import base64
+import functools
+import shutil
 import secrets
-import requests
-import docker
-import yaml
+import threading
 import subprocess
-from packaging.version import Version, InvalidVersion
-from InquirerPy import prompt
+import click
+from dataclasses import dataclass
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
-from rich import print
+# docker, yaml, requests, packaging and InquirerPy are imported inside the
+# functions that use them, so startup does not pay for modules a run may
+# never need. Python caches them after the first import.
 
-import urllib3
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-console = Console()
+# Markup is kept for the colour tags; automatic highlighting of numbers,
+# paths etc. is not used and only costs time on every print.
+console = Console(highlight=False)
+# Errors (and the generated admin credentials) go to stderr and are shown
+# even with --quiet.
+error_console = Console(stderr=True, highlight=False)
 
 # ─── Constants ───────────────────────────────────────────────
 
@@ -30,124 +40,360 @@ NEXTCLOUD_REPO = "library/nextcloud"
 POSTGRES_REPO  = "library/postgres"
 REDIS_REPO     = "library/redis"
 NGINX_REPO     = "library/nginx"
+NGINX_IMAGE    = "ghcr.io/nextcloud-cli/nextcloud-nginx:latest"
+NGINX_LOCAL_IMAGE = "nextcloud-nginx:local"  # Tag of the fallback build from templates/
+PASSWORD_BYTES = 24  # 192 bits of entropy, 32 URL-safe characters
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
 MAX_PAGE = 100  # Maximum number of pages to load
+TAG_PAGE_SIZE = 100  # Docker Hub maximum; the first page usually suffices
+TAG_FETCH_WORKERS = 8  # Concurrent Docker Hub page requests
+HUB_TIMEOUT = (3.05, 10)  # Connect and read timeouts in seconds
+HUB_RETRIES = 3
+HUB_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})  # Retried with backoff
+LOG_FILE_NAME = "netzint-cli.log"  # Written to the base path when a command fails
+OCC_READY_TIMEOUT = 300  # Seconds to wait for Nextcloud between OCC commands
+# Tags containing any of these substrings are never offered
+_NC_SKIP_RE = re.compile(r"apache|windows|rc|beta")
+_SEMVER_SKIP_RE = re.compile(r"windows|rc|beta")
+# Plain release numbers (e.g. "16", "1.27.3"); anything else is not parsed
+_SEMVER_RE = re.compile(r"^\d+(?:\.\d+)*$")
+TAG_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "nextcloud-cli", "tags.json")
+
+def _env_seconds(name, default):
+    """Reads a number of seconds from the environment; invalid values fall back to default."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        error_console.print(f"[bright_yellow]Ignoring invalid {name}={value!r}, using {default} seconds.[/bright_yellow]")
+        return default
+
+TAG_CACHE_TTL = _env_seconds("NC_CLI_TAG_TTL", 3600)
 
 # ─── Utility Functions ─────────────────────────────────────────
 
 def generate_password():
     """Generates a secure, random password."""
-    return secrets.token_hex(8)
+    return secrets.token_urlsafe(PASSWORD_BYTES)
+
+def generate_passwords(count):
+    """Generates count secure, random passwords from a single read of the OS random source."""
+    buf = os.urandom(PASSWORD_BYTES * count)
+    return [
+        base64.urlsafe_b64encode(buf[i * PASSWORD_BYTES:(i + 1) * PASSWORD_BYTES]).decode().rstrip("=")
+        for i in range(count)
+    ]
+
+_log_lock = threading.Lock()
 
-def maybe_container_name(base_name, version_str):
+def _log_failure(err, label, base_path):
     """
-    Returns a container name in the format 'nextcloud-{base_name}'.
-    The version information is not appended.
+    Appends the captured output of a failed command (CalledProcessError) to the
+    log file in the base path and shows its last lines.
     """
-    return f"nextcloud-{base_name}"
+    log_file = os.path.join(base_path, LOG_FILE_NAME)
+    try:
+        with _log_lock, open(log_file, "a") as f:
+            f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {label} failed (exit code {err.returncode}): {' '.join(err.cmd)}\n")
+            f.write(f"--- stdout ---\n{err.stdout or ''}\n--- stderr ---\n{err.stderr or ''}\n")
+    except OSError as e:
+        error_console.print(f"[bright_yellow]Could not write log file {log_file}: {e}[/bright_yellow]")
+    # Without separate stderr (e.g. OCC via the Docker SDK) show the combined output.
+    output_tail = "\n".join((err.stderr or err.stdout or "").splitlines()[-20:])
+    if output_tail:
+        error_console.print(output_tail, markup=False, style="bright_red")
+    error_console.print(f"[bright_yellow]Full output written to {log_file}.[/bright_yellow]")
+
+def _run(cmd, label, base_path, **kwargs):
+    """
+    Runs a command with its output captured (check=True).
+    On failure, the output is logged via _log_failure, then the CalledProcessError
+    is re-raised.
+    """
+    try:
+        return subprocess.run(cmd, capture_output=True, text=True, check=True, **kwargs)
+    except subprocess.CalledProcessError as err:
+        _log_failure(err, label, base_path)
+        raise
 
 # ─── Docker Hub Version Fetching ───────────────────────────────
 
+_hub_client = None
+_hub_client_lock = threading.Lock()
+
+def _get_hub_client():
+    """
+    Returns the shared HTTP client for Docker Hub.
+    If httpx with HTTP/2 support is installed, all concurrent page requests are
+    multiplexed over a single TLS connection; otherwise a requests session keeps
+    its connections alive and reuses them across page requests.
+    Both clients retry failed connections; HTTP 429 and 5xx responses are
+    retried by _fetch_tag_page for either client.
+    """
+    global _hub_client
+    with _hub_client_lock:
+        if _hub_client is None:
+            try:
+                import httpx
+                # Raises ImportError if the optional "h2" package is missing.
+                _hub_client = httpx.Client(
+                    http2=True,
+                    timeout=httpx.Timeout(HUB_TIMEOUT[1], connect=HUB_TIMEOUT[0]),
+                    transport=httpx.HTTPTransport(http2=True, retries=HUB_RETRIES),
+                )
+            except ImportError:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                class _HubAdapter(HTTPAdapter):
+                    """HTTPAdapter that applies HUB_TIMEOUT to requests sent without an explicit timeout."""
+                    def send(self, request, **kwargs):
+                        if kwargs.get("timeout") is None:
+                            kwargs["timeout"] = HUB_TIMEOUT
+                        return super().send(request, **kwargs)
+
+                session = requests.Session()
+                # Connection failures only; statuses are retried by _fetch_tag_page.
+                retry = Retry(
+                    total=HUB_RETRIES,
+                    respect_retry_after_header=False,
+                    backoff_factor=0.5,
+                    allowed_methods=["GET"],
+                )
+                adapter = _HubAdapter(max_retries=retry, pool_connections=TAG_FETCH_WORKERS, pool_maxsize=TAG_FETCH_WORKERS)
+                session.mount("https://", adapter)
+                _hub_client = session
+        return _hub_client
+
+def _fetch_tag_page(docker_repo, page):
+    """
+    Fetches a single page of tags for a Docker Hub repository.
+    Responses with a status in HUB_RETRY_STATUSES are retried up to HUB_RETRIES
+    times with exponential backoff (or the server's Retry-After, capped at 30s).
+    """
+    url = f"https://hub.docker.com/v2/repositories/{docker_repo}/tags?page_size={TAG_PAGE_SIZE}&page={page}"
+    client = _get_hub_client()
+    for attempt in range(HUB_RETRIES + 1):
+        resp = client.get(url)
+        if resp.status_code not in HUB_RETRY_STATUSES or attempt == HUB_RETRIES:
+            break
+        retry_after = resp.headers.get("Retry-After", "")
+        delay = int(retry_after) if retry_after.isdigit() else 0.5 * 2 ** attempt
+        time.sleep(min(delay, 30))
+    resp.raise_for_status()
+    return resp.json()
+
+def _fetch_tag_pages(docker_repo):
+    """
+    Yields the tag results of a Docker Hub repository page by page.
+    The first page is fetched directly to learn the total tag count; the
+    remaining pages are then requested concurrently, TAG_FETCH_WORKERS at a
+    time, so the caller can stop iterating once it has seen enough tags.
+    """
+    data = _fetch_tag_page(docker_repo, 1)
+    yield data.get("results", [])
+    num_pages = min(math.ceil(data.get("count", 0) / TAG_PAGE_SIZE), MAX_PAGE)
+    if num_pages < 2:
+        return
+    with ThreadPoolExecutor(max_workers=TAG_FETCH_WORKERS) as executor:
+        for start in range(2, num_pages + 1, TAG_FETCH_WORKERS):
+            pages = range(start, min(start + TAG_FETCH_WORKERS, num_pages + 1))
+            for page_data in executor.map(lambda page: _fetch_tag_page(docker_repo, page), pages):
+                results = page_data.get("results", [])
+                if not results:
+                    return
+                yield results
+
+# ─── Docker Hub Tag Cache ──────────────────────────────────────
+
+_refresh_tags = False  # Set by --refresh-tags to bypass the cache
+_tag_cache = None  # In-memory copy of the cache file, loaded on first use
+_tag_cache_lock = threading.Lock()
+_process_started = time.time()
+
+def _tag_cache_load():
+    """Loads the tag cache file; returns an empty cache if it is missing or unreadable."""
+    try:
+        with open(TAG_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _tag_cache_entries():
+    """Returns the in-memory tag cache, reading the cache file only once per process."""
+    global _tag_cache
+    if _tag_cache is None:
+        _tag_cache = _tag_cache_load()
+    return _tag_cache
+
+def _tag_cache_get(repo):
+    """Returns the cached version list for repo, or None if missing, expired or bypassed."""
+    with _tag_cache_lock:
+        entry = _tag_cache_entries().get(repo)
+    if not entry or time.time() - entry.get("fetched_at", 0) >= TAG_CACHE_TTL:
+        return None
+    # With --refresh-tags only results fetched by this run count.
+    if _refresh_tags and entry["fetched_at"] < _process_started:
+        return None
+    return entry.get("tags")
+
+def _tag_cache_put(repo, tags):
+    """Stores the version list for repo in the tag cache (written atomically)."""
+    with _tag_cache_lock:
+        cache = _tag_cache_entries()
+        cache[repo] = {"fetched_at": time.time(), "tags": tags}
+        tmp_file = f"{TAG_CACHE_FILE}.tmp"
+        try:
+            os.makedirs(os.path.dirname(TAG_CACHE_FILE), exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, TAG_CACHE_FILE)
+        except OSError as e:
+            console.print(f"[bright_yellow]Could not write tag cache: {e}[/bright_yellow]")
+
+def cached_tags(cache_key):
+    """
+    Decorator for the version fetchers: results are served from the tag cache
+    (in memory for the process, on disk for TAG_CACHE_TTL seconds) and only
+    non-empty results are stored. cache_key maps the fetcher's arguments to the
+    cache key.
+    """
+    def decorator(fetch):
+        @functools.wraps(fetch)
+        def wrapper(*args, **kwargs):
+            key = cache_key(*args, **kwargs)
+            cached = _tag_cache_get(key)
+            if cached is not None:
+                return list(cached)
+            tags = fetch(*args, **kwargs)
+            if tags:
+                _tag_cache_put(key, list(tags))
+            return tags
+        return wrapper
+    return decorator
+
+@cached_tags(lambda: f"{NEXTCLOUD_REPO}:fpm")
 def fetch_nextcloud_fpm_versions():
     """
     Fetch up to 100 tags for Nextcloud (FPM variants) from Docker Hub and return
     up to 10 distinct major versions (sorted in descending order).
     Only valid version tags are returned – "latest" is never used.
+    Results are served from the tag cache while it is fresh.
     """
+    from packaging.version import Version, InvalidVersion
     console.print("[bright_blue]🔎 Fetching Nextcloud-FPM versions from Docker Hub...[/bright_blue]")
-    all_fpm_versions = []
+    best = {}  # major -> (Version, tag) of the newest tag seen for that major
+    accepted = 0
     try:
-        page = 1
-        page_size = 50
-        while page <= MAX_PAGE and len(all_fpm_versions) < 100:
-            url = f"https://hub.docker.com/v2/repositories/{NEXTCLOUD_REPO}/tags?page_size={page_size}&page={page}"
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            results = data.get("results", [])
-            if not results:
-                break
+        for results in _fetch_tag_pages(NEXTCLOUD_REPO):
             for item in results:
                 tag_name = item.get("name", "")
                 # Skip unwanted tags
-                if any(sub in tag_name for sub in ["apache", "windows", "rc", "beta"]):
+                if _NC_SKIP_RE.search(tag_name):
                     continue
                 if "fpm" not in tag_name:
                     continue
+                core_ver = tag_name.replace("-fpm", "")
+                if not _SEMVER_RE.match(core_ver):
+                    continue
                 try:
-                    core_ver = tag_name.replace("-fpm", "")
-                    Version(core_ver)
-                    all_fpm_versions.append(tag_name)
+                    core = Version(core_ver)
                 except InvalidVersion:
                     continue
-            if not data.get("next"):
-                break
-            page += 1
-
-        def parse_core(tag):
-            return Version(tag.replace("-fpm", ""))
-        sorted_tags = sorted(set(all_fpm_versions), key=lambda x: parse_core(x), reverse=True)
-        distinct_majors = {}
-        for full_tag in sorted_tags:
-            core = parse_core(full_tag)
-            if core.major not in distinct_majors:
-                distinct_majors[core.major] = full_tag
-            if len(distinct_majors) >= 10:
+                accepted += 1
+                current = best.get(core.major)
+                if current is None or core > current[0]:
+                    best[core.major] = (core, tag_name)
+            # Tags come newest first, so stop once enough majors are known.
+            if accepted >= 100 or len(best) >= 10:
                 break
-        final_list = list(distinct_majors.values())
-        # Return in descending order by default.
-        final_list = sorted(final_list, key=lambda x: parse_core(x), reverse=True)
-        return final_list
+
+        return [tag for _, tag in sorted(best.values(), reverse=True)[:10]]
     except Exception as e:
-        console.print(f"[bright_red]Error fetching Nextcloud-FPM versions: {e}[/bright_red]")
+        error_console.print(f"[bright_red]Error fetching Nextcloud-FPM versions: {e}[/bright_red]")
         return []
 
+def _semver_cache_key(docker_repo, max_count=10, filter_substrings=None):
+    """
+    Cache key for fetch_semver_versions. Calls with the default arguments use the
+    bare repository name; any other max_count or filter gets its own entry.
+    """
+    if filter_substrings is None:
+        pattern = None
+    elif isinstance(filter_substrings, re.Pattern):
+        pattern = filter_substrings.pattern
+    else:
+        pattern = "|".join(filter_substrings)
+    if max_count == 10 and pattern is None:
+        return docker_repo
+    return f"{docker_repo}|{max_count}|{pattern}"
+
+@cached_tags(_semver_cache_key)
 def fetch_semver_versions(docker_repo, max_count=10, filter_substrings=None):
     """
     Fetch valid SemVer tags from a Docker repository and return up to max_count
     distinct major versions (sorted in descending order).
     "latest" is never returned.
+    filter_substrings may be a list of substrings or a compiled pattern; tags
+    matching it are skipped.
+    Results are served from the tag cache while it is fresh.
     """
+    from packaging.version import Version, InvalidVersion
     if filter_substrings is None:
-        filter_substrings = ["windows", "rc", "beta"]
-    all_versions = []
+        skip_re = _SEMVER_SKIP_RE
+    elif isinstance(filter_substrings, re.Pattern):
+        skip_re = filter_substrings
+    elif filter_substrings:
+        skip_re = re.compile("|".join(map(re.escape, filter_substrings)))
+    else:
+        skip_re = None
+    best = {}  # major -> (Version, tag) of the newest tag seen for that major
+    accepted = 0
     try:
-        page = 1
-        page_size = 50
-        while page <= MAX_PAGE and len(all_versions) < 100:
-            url = f"https://hub.docker.com/v2/repositories/{docker_repo}/tags?page_size={page_size}&page={page}"
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            results = data.get("results", [])
-            if not results:
-                break
+        for results in _fetch_tag_pages(docker_repo):
             for item in results:
                 tag_name = item.get("name", "")
-                if any(sub in tag_name for sub in filter_substrings):
+                if skip_re is not None and skip_re.search(tag_name):
+                    continue
+                if not _SEMVER_RE.match(tag_name):
                     continue
                 try:
-                    Version(tag_name)
-                    all_versions.append(tag_name)
+                    ver = Version(tag_name)
                 except InvalidVersion:
                     continue
-            if not data.get("next"):
+                accepted += 1
+                current = best.get(ver.major)
+                if current is None or ver > current[0]:
+                    best[ver.major] = (ver, tag_name)
+            # Tags come newest first, so stop once enough majors are known.
+            if accepted >= 100 or len(best) >= max_count:
                 break
-            page += 1
-        sorted_tags = sorted(set(all_versions), key=lambda x: Version(x), reverse=True)
-        distinct = {}
-        for tag in sorted_tags:
-            ver = Version(tag)
-            if ver.major not in distinct:
-                distinct[ver.major] = tag
-            if len(distinct) >= max_count:
-                break
-        final_list = list(distinct.values())
-        final_list = sorted(final_list, key=lambda x: Version(x), reverse=True)
-        return final_list
+        return [tag for _, tag in sorted(best.values(), reverse=True)[:max_count]]
     except Exception as e:
-        console.print(f"[bright_red]Error fetching versions for {docker_repo}: {e}[/bright_red]")
+        error_console.print(f"[bright_red]Error fetching versions for {docker_repo}: {e}[/bright_red]")
         return []
 
+def prefetch_all_versions(settings):
+    """
+    Fetches the version lists for all selected services concurrently and returns
+    them keyed by service ("postgres", "redis", "nextcloud", "nginx").
+    """
+    fetchers = {
+        "postgres": (settings.install_postgres, fetch_semver_versions, (POSTGRES_REPO,)),
+        "redis": (settings.install_redis, fetch_semver_versions, (REDIS_REPO,)),
+        "nextcloud": (settings.install_nextcloud, fetch_nextcloud_fpm_versions, ()),
+        "nginx": (settings.install_nginx, fetch_semver_versions, (NGINX_REPO,)),
+    }
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        futures = {
+            name: executor.submit(fetcher, *args)
+            for name, (selected, fetcher, args) in fetchers.items() if selected
+        }
+    return {name: future.result() for name, future in futures.items()}
+
 # ─── Postgres Healthcheck ───────────────────────────────────────
 
 def postgres_healthcheck(pg_user, pg_password):
@@ -174,31 +420,40 @@ def setup_nginx_build_folder(base_path):
     Sets up the Nginx build folder:
       - Copies nginx.conf into the folder
       - Creates a Dockerfile in the same folder.
+    Both files are copied from the templates folder next to this script.
     """
     target = os.path.join(base_path, "nextcloud-nginx")
     try:
         os.makedirs(target, exist_ok=True)
     except Exception as e:
-        console.print(f"[bright_red]Error creating folder {target}: {e}[/bright_red]")
+        error_console.print(f"[bright_red]Error creating folder {target}: {e}[/bright_red]")
         return
 
     target_nginx_conf = os.path.join(target, "nginx.conf")
-    nginx_conf = getNginxConf()
     try:
-        with open(target_nginx_conf, "w") as f:
-            f.write(nginx_conf)
+        shutil.copyfile(os.path.join(TEMPLATE_DIR, "nginx.conf"), target_nginx_conf)
         console.print(f"[bright_green]nginx.conf copied to {target_nginx_conf}.[/bright_green]")
     except Exception as e:
-        console.print(f"[bright_red]Error copying nginx.conf: {e}[/bright_red]")
+        error_console.print(f"[bright_red]Error copying nginx.conf: {e}[/bright_red]")
 
     dockerfile_path = os.path.join(target, "Dockerfile")
-    dockerfile_content = "FROM nginx:alpine\nCOPY nginx.conf /etc/nginx/nginx.conf\n"
     try:
-        with open(dockerfile_path, "w") as f:
-            f.write(dockerfile_content)
+        shutil.copyfile(os.path.join(TEMPLATE_DIR, "Dockerfile"), dockerfile_path)
         console.print(f"[bright_green]Dockerfile created in {dockerfile_path}.[/bright_green]")
     except Exception as e:
-        console.print(f"[bright_red]Error creating Dockerfile: {e}[/bright_red]")
+        error_console.print(f"[bright_red]Error creating Dockerfile: {e}[/bright_red]")
+
+def _existing_dirs(*parents):
+    """Returns the given parent folders that exist plus all folders directly inside them."""
+    existing = set()
+    for parent in parents:
+        try:
+            with os.scandir(parent) as entries:
+                existing.add(parent)
+                existing.update(entry.path for entry in entries if entry.is_dir())
+        except OSError:
+            continue
+    return existing
 
 def create_local_directories(base_path):
     """Creates the required local folders for Docker volumes."""
@@ -215,256 +470,85 @@ def create_local_directories(base_path):
             os.path.join(base_path, "data", "nginx_conf"),
             os.path.join(base_path, "nextcloud-nginx")
         ]
-        for d in dirs:
+        def make_dir(d):
             try:
-                os.makedirs(d, exist_ok=True)
+                if d == base_path:
+                    os.makedirs(d, exist_ok=True)
+                else:
+                    os.mkdir(d)
+            except FileExistsError:
+                pass
             except Exception as e:
-                console.print(f"[bright_red]Error creating folder {d}: {e}[/bright_red]")
+                error_console.print(f"[bright_red]Error creating folder {d}: {e}[/bright_red]")
+
+        # Two directory listings tell us what already exists (the usual case on
+        # reruns). The parent folders are created first; the independent volume
+        # folders below them are then created in parallel with plain mkdir calls.
+        data_path = os.path.join(base_path, "data")
+        existing = _existing_dirs(base_path, data_path)
+        missing = [d for d in dirs if d not in existing]
+        for d in (base_path, data_path):
+            if d in missing:
+                make_dir(d)
+        leaves = [d for d in missing if d not in (base_path, data_path)]
+        if leaves:
+            with ThreadPoolExecutor(max_workers=min(len(leaves), 8)) as executor:
+                list(executor.map(make_dir, leaves))
         console.print("[bright_green]Local folders created (if not already present).[/bright_green]")
     else:
         console.print("[bright_yellow]Please ensure that the folders exist![/bright_yellow]")
 
+def _yaml_loader():
+    """Returns the libyaml-backed safe loader, falling back to the pure-Python one."""
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return Loader
+
+def _yaml_dumper():
+    """Returns the libyaml-backed safe dumper, falling back to the pure-Python one."""
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+    return Dumper
+
 def write_compose_file(compose_data, base_path):
     """Writes the docker-compose.yml file in the base path."""
+    import yaml
     compose_file = os.path.join(base_path, "docker-compose.yml")
     try:
         with open(compose_file, "w") as f:
-            yaml.dump(compose_data, f, default_flow_style=False)
+            yaml.dump(compose_data, f, Dumper=_yaml_dumper(), default_flow_style=False, sort_keys=False)
         console.print(f"\n[bright_green]✅ Docker-compose file '{compose_file}' created![/bright_green]")
     except Exception as e:
-        console.print(f"[bright_red]Error writing compose file: {e}[/bright_red]")
+        error_console.print(f"[bright_red]Error writing compose file: {e}[/bright_red]")
 
 def create_env_file(path, pg_pass, nc_db_user, nc_db_pass, redis_pass, nc_admin_user, nc_admin_pass):
     """
     Writes all sensitive data into the nextcloud.env file.
     """
-    lines = [
-        "# nextcloud.env for Nextcloud-FPM + PostgreSQL + Redis + Nginx",
-        f"POSTGRES_PASSWORD={pg_pass}",
-        f"NEXTCLOUD_DB_USER={nc_db_user}",
-        f"POSTGRES_USER={nc_db_user}",
-        "POSTGRES_DB=nextcloud",
-        f"NEXTCLOUD_DB_PASSWORD={nc_db_pass}",
-        f"REDIS_PASS={redis_pass}",
-        f"NEXTCLOUD_ADMIN_USER={nc_admin_user}",
-        f"NEXTCLOUD_ADMIN_PASSWORD={nc_admin_pass}",
-        f"NEXTCLOUD_TRUSTED_DOMAINS=",
-        f"POSTGRES_HOST=nextcloud-postgres",
-        f"REDIS_HOST=nextcoud-redis",
-        ""
-    ]
+    content = (
+        "# nextcloud.env for Nextcloud-FPM + PostgreSQL + Redis + Nginx\n"
+        f"POSTGRES_PASSWORD={pg_pass}\n"
+        f"NEXTCLOUD_DB_USER={nc_db_user}\n"
+        f"POSTGRES_USER={nc_db_user}\n"
+        "POSTGRES_DB=nextcloud\n"
+        f"NEXTCLOUD_DB_PASSWORD={nc_db_pass}\n"
+        f"REDIS_PASS={redis_pass}\n"
+        f"NEXTCLOUD_ADMIN_USER={nc_admin_user}\n"
+        f"NEXTCLOUD_ADMIN_PASSWORD={nc_admin_pass}\n"
+        "NEXTCLOUD_TRUSTED_DOMAINS=\n"
+        "POSTGRES_HOST=nextcloud-postgres\n"
+        "REDIS_HOST=nextcoud-redis\n"
+    )
     try:
         with open(path, "w") as f:
-            f.write("\n".join(lines))
+            f.write(content)
         console.print(f"[bright_green]Created 'nextcloud.env' at {path} with all credentials.[/bright_green]")
     except Exception as e:
-        console.print(f"[bright_red]Error creating env file: {e}[/bright_red]")
-
-def getNginxConf():
-    """Returns the content of nginx.conf as a placeholder."""
-    return r"""
-worker_processes auto;
-
-error_log  /var/log/nginx/error.log warn;
-pid        /var/run/nginx.pid;
-
-
-events {
-    worker_connections  1024;
-}
-
-
-http {
-    include mime.types;
-    default_type  application/octet-stream;
-    types {
-        text/javascript mjs;
-        application/wasm wasm;
-    }
-
-    log_format  main  '$remote_addr - $remote_user [$time_local] "$request" '
-                      '$status $body_bytes_sent "$http_referer" '
-                      '"$http_user_agent" "$http_x_forwarded_for"';
-
-    access_log  /var/log/nginx/access.log  main;
-
-    sendfile        on;
-    #tcp_nopush     on;
-
-    # Prevent nginx HTTP Server Detection
-    server_tokens   off;
-
-    keepalive_timeout  65;
-
-    # Set the `immutable` cache control options only for assets with a cache busting `v` argument
-    map $arg_v $asset_immutable {
-        "" "";
-    default ", immutable";
-    }
-
-    #gzip  on;
-
-    upstream php-handler {
-        server nextcloud-fpm:9000;
-    }
-
-    server {
-        listen 80;
-
-        # HSTS settings
-        # WARNING: Only add the preload option once you read about
-        # the consequences in https://hstspreload.org/. This option
-        # will add the domain to a hardcoded list that is shipped
-        # in all major browsers and getting removed from this list
-        # could take several months.
-        #add_header Strict-Transport-Security "max-age=15768000; includeSubDomains; preload;" always;
-
-        # set max upload size and increase upload timeout:
-        client_max_body_size 512M;
-        client_body_timeout 300s;
-        fastcgi_buffers 64 4K;
-
-        # The settings allows you to optimize the HTTP2 bandwidth.
-        # See https://blog.cloudflare.com/delivering-http-2-upload-speed-improvements/
-        # for tuning hints
-        client_body_buffer_size 512k;
-
-        # Enable gzip but do not remove ETag headers
-        gzip on;
-        gzip_vary on;
-        gzip_comp_level 4;
-        gzip_min_length 256;
-        gzip_proxied expired no-cache no-store private no_last_modified no_etag auth;
-        gzip_types application/atom+xml text/javascript application/javascript application/json application/ld+json application/manifest+json application/rss+xml application/vnd.geo+json application/vnd.ms-fontobject application/wasm application/x-font-ttf application/x-web-app-manifest+json application/xhtml+xml application/xml font/opentype image/bmp image/svg+xml image/x-icon text/cache-manifest text/css text/plain text/vcard text/vnd.rim.location.xloc text/vtt text/x-component text/x-cross-domain-policy;
-
-        # Pagespeed is not supported by Nextcloud, so if your server is built
-        # with the `ngx_pagespeed` module, uncomment this line to disable it.
-        #pagespeed off;
-
-        # HTTP response headers borrowed from Nextcloud `.htaccess`
-        add_header Referrer-Policy                      "no-referrer"       always;
-        add_header X-Content-Type-Options               "nosniff"           always;
-        add_header X-Frame-Options                      "SAMEORIGIN"        always;
-        add_header X-Permitted-Cross-Domain-Policies    "none"              always;
-        add_header X-Robots-Tag                         "noindex, nofollow" always;
-        add_header X-XSS-Protection                     "1; mode=block"     always;
-
-        # Remove X-Powered-By, which is an information leak
-        fastcgi_hide_header X-Powered-By;
-
-        # Path to the root of your installation
-        root /var/www/html;
-
-        # Specify how to handle directories -- specifying `/index.php$request_uri`
-        # here as the fallback means that Nginx always exhibits the desired behaviour
-        # when a client requests a path that corresponds to a directory that exists
-        # on the server. In particular, if that directory contains an index.php file,
-        # that file is correctly served; if it doesn't, then the request is passed to
-        # the front-end controller. This consistent behaviour means that we don't need
-        # to specify custom rules for certain paths (e.g. images and other assets,
-        # `/updater`, `/ocm-provider`, `/ocs-provider`), and thus
-        # `try_files $uri $uri/ /index.php$request_uri`
-        # always provides the desired behaviour.
-        index index.php index.html /index.php$request_uri;
-
-        # Rule borrowed from `.htaccess` to handle Microsoft DAV clients
-        location = / {
-            if ( $http_user_agent ~ ^DavClnt ) {
-                return 302 /remote.php/webdav/$is_args$args;
-            }
-        }
-
-        location = /robots.txt {
-            allow all;
-            log_not_found off;
-            access_log off;
-        }
-
-        # Make a regex exception for `/.well-known` so that clients can still
-        # access it despite the existence of the regex rule
-        # `location ~ /(\.|autotest|...)` which would otherwise handle requests
-        # for `/.well-known`.
-        location ^~ /.well-known {
-            # The rules in this block are an adaptation of the rules
-            # in `.htaccess` that concern `/.well-known`.
-
-            location = /.well-known/carddav { return 301 /remote.php/dav/; }
-            location = /.well-known/caldav  { return 301 /remote.php/dav/; }
-
-            location /.well-known/acme-challenge    { try_files $uri $uri/ =404; }
-            location /.well-known/pki-validation    { try_files $uri $uri/ =404; }
-
-            # Let Nextcloud's API for `/.well-known` URIs handle all other
-            # requests by passing them to the front-end controller.
-            return 301 /index.php$request_uri;
-        }
-
-        # Rules borrowed from `.htaccess` to hide certain paths from clients
-        location ~ ^/(?:build|tests|config|lib|3rdparty|templates|data)(?:$|/)  { return 404; }
-        location ~ ^/(?:\.|autotest|occ|issue|indie|db_|console)                { return 404; }
-
-        # Ensure this block, which passes PHP files to the PHP process, is above the blocks
-        # which handle static assets (as seen below). If this block is not declared first,
-        # then Nginx will encounter an infinite rewriting loop when it prepends `/index.php`
-        # to the URI, resulting in a HTTP 500 error response.
-        location ~ \.php(?:$|/) {
-            # Required for legacy support
-            rewrite ^/(?!index|remote|public|cron|core\/ajax\/update|status|ocs\/v[12]|updater\/.+|ocs-provider\/.+|.+\/richdocumentscode(_arm64)?\/proxy) /index.php$request_uri;
-
-            fastcgi_split_path_info ^(.+?\.php)(/.*)$;
-            set $path_info $fastcgi_path_info;
-
-            try_files $fastcgi_script_name =404;
-
-            include fastcgi_params;
-            fastcgi_param SCRIPT_FILENAME $document_root$fastcgi_script_name;
-            fastcgi_param PATH_INFO $path_info;
-            #fastcgi_param HTTPS on;
-
-            fastcgi_param modHeadersAvailable true;         # Avoid sending the security headers twice
-            fastcgi_param front_controller_active true;     # Enable pretty urls
-            fastcgi_pass php-handler;
-
-            fastcgi_intercept_errors on;
-            fastcgi_request_buffering off;
-
-            fastcgi_max_temp_file_size 0;
-        }
-
-        # Serve static files
-        location ~ \.(?:css|js|mjs|svg|gif|ico|jpg|png|webp|wasm|tflite|map|ogg|flac)$ {
-            try_files $uri /index.php$request_uri;
-            add_header Cache-Control "public, max-age=15778463$asset_immutable";
-            add_header Referrer-Policy                   "no-referrer"       always;
-            add_header X-Content-Type-Options            "nosniff"           always;
-            add_header X-Frame-Options                   "SAMEORIGIN"        always;
-            add_header X-Permitted-Cross-Domain-Policies "none"              always;
-            add_header X-Robots-Tag                      "noindex, nofollow" always;
-            add_header X-XSS-Protection                  "1; mode=block"     always;
-            access_log off;     # Optional: Don't log access to assets
-
-            location ~ \.wasm$ {
-                default_type application/wasm;
-            }
-        }
-
-        location ~ \.(otf|woff2?)$ {
-            try_files $uri /index.php$request_uri;
-            expires 7d;         # Cache-Control policy borrowed from `.htaccess`
-            access_log off;     # Optional: Don't log access to assets
-        }
-
-        # Rule borrowed from `.htaccess`
-        location /remote {
-            return 301 /remote.php$request_uri;
-        }
-
-        location / {
-            try_files $uri $uri/ /index.php$request_uri;
-        }
-    }
-}
- """
+        error_console.print(f"[bright_red]Error creating env file: {e}[/bright_red]")
 
 # ─── Menu and Configuration Prompts ───────────────────────────
 
@@ -473,6 +557,7 @@ def start_menu():
     Displays a menu where the user first chooses the service (Nextcloud or Moodle)
     and then selects whether to install or update. The user can also specify the base path.
     """
+    from InquirerPy import prompt
     art = r"""
     _   __     __        _       __     ____             __                ________    ____
    / | / /__  / /_____  (_)___  / /_   / __ \____  _____/ /_____  _____   / ____/ /   /  _/
@@ -500,37 +585,51 @@ def start_menu():
     base_path = prompt_base_path()
     return service["service"], action["action"], base_path
 
+@dataclass
+class InstallSettings:
+    """Settings collected by prompt_installation_settings."""
+    install_nextcloud: bool
+    install_postgres: bool
+    install_redis: bool
+    install_nginx: bool
+    postgres_password: str
+    nextcloud_db_user: str
+    nextcloud_db_pass: str
+    redis_pass: str
+    nc_admin_user: str
+    nc_admin_pass: str
+    # Chosen in build_compose_services once the available versions are known.
+    nc_fpm_version: Optional[str] = None
+
 def prompt_installation_settings():
     """
-    Asks if automatic installation should be used and returns all necessary settings.
+    Asks if automatic installation should be used and returns all necessary settings
+    as an InstallSettings instance.
     """
     console.print("[bright_blue]Configuring services...[/bright_blue]")
     auto_install = Confirm.ask("[bright_green]Start automatic installation?[/bright_green]", default=True)
 
     if auto_install:
-        return {
-            "install_nextcloud": True,
-            "install_postgres": True,
-            "install_redis": True,
-            "install_nginx": True,
-            "postgres_password": generate_password(),
-            "nextcloud_db_user": "nextcloud",
-            "nextcloud_db_pass": generate_password(),
-            "redis_pass": generate_password(),
-            "nc_admin_user": "admin",
-            "nc_admin_pass": generate_password(),
-            # This value will later be replaced with the latest version.
-            "nc_fpm_version": None,
-        }
+        pg_pass, nc_db_pass, redis_pass, nc_admin_pass = generate_passwords(4)
+        return InstallSettings(
+            install_nextcloud=True,
+            install_postgres=True,
+            install_redis=True,
+            install_nginx=True,
+            postgres_password=pg_pass,
+            nextcloud_db_user="nextcloud",
+            nextcloud_db_pass=nc_db_pass,
+            redis_pass=redis_pass,
+            nc_admin_user="admin",
+            nc_admin_pass=nc_admin_pass,
+        )
     else:
         install_postgres = Confirm.ask("[bright_green]Install PostgreSQL?[/bright_green]", default=True)
         install_redis    = Confirm.ask("[bright_green]Install Redis?[/bright_green]", default=True)
         install_nginx    = Confirm.ask("[bright_green]Install Nginx?[/bright_green]", default=True)
         if Confirm.ask("[bright_yellow]Generate random passwords?[/bright_yellow]", default=True):
-            pg_pass = generate_password()
+            pg_pass, nc_db_pass, redis_pass = generate_passwords(3)
             nc_db_user = "nextcloud"
-            nc_db_pass = generate_password()
-            redis_pass = generate_password()
         else:
             pg_pass = Prompt.ask("[bright_yellow]Postgres password[/bright_yellow]")
             nc_db_user = Prompt.ask("[bright_yellow]Nextcloud DB user?[/bright_yellow]", default="nextcloud")
@@ -538,19 +637,18 @@ def prompt_installation_settings():
             redis_pass = Prompt.ask("[bright_yellow]Redis password (optional)[/bright_yellow]", default="")
         nc_admin_user = Prompt.ask("[bright_yellow]Nextcloud admin user?[/bright_yellow]", default="admin")
         nc_admin_pass = Prompt.ask("[bright_yellow]Nextcloud admin password?[/bright_yellow]", default=generate_password())
-        return {
-            "install_nextcloud": True,
-            "install_postgres": install_postgres,
-            "install_redis": install_redis,
-            "install_nginx": install_nginx,
-            "postgres_password": pg_pass,
-            "nextcloud_db_user": nc_db_user,
-            "nextcloud_db_pass": nc_db_pass,
-            "redis_pass": redis_pass,
-            "nc_admin_user": nc_admin_user,
-            "nc_admin_pass": nc_admin_pass,
-            "nc_fpm_version": None,
-        }
+        return InstallSettings(
+            install_nextcloud=True,
+            install_postgres=install_postgres,
+            install_redis=install_redis,
+            install_nginx=install_nginx,
+            postgres_password=pg_pass,
+            nextcloud_db_user=nc_db_user,
+            nextcloud_db_pass=nc_db_pass,
+            redis_pass=redis_pass,
+            nc_admin_user=nc_admin_user,
+            nc_admin_pass=nc_admin_pass,
+        )
 
 def prompt_nginx_ports():
     """Prompts for custom HTTP/HTTPS ports for Nginx."""
@@ -564,16 +662,23 @@ def prompt_nginx_ports():
 
 # ─── Compose Services Creation ──────────────────────────────────
 
-def build_compose_services(settings, nginx_http_port, nginx_https_port, env_file, base_path):
+def build_compose_services(settings, version_cache, nginx_http_port, nginx_https_port, env_file, base_path):
     """
     Builds the dictionary for docker-compose.yml based on the settings.
+    Version choices are offered from version_cache (see prefetch_all_versions).
     Volume paths are set relative to the base path.
     """
+    from InquirerPy import prompt
+    data_root = os.path.join(base_path, "data")
+    paths = {
+        name: os.path.join(data_root, f"nc_{name}")
+        for name in ("postgres", "redis", "html", "config", "custom_apps", "data")
+    }
     services = {}
 
     # PostgreSQL Service
-    if settings["install_postgres"]:
-        postgres_versions = fetch_semver_versions(POSTGRES_REPO)
+    if settings.install_postgres:
+        postgres_versions = version_cache["postgres"]
         if Confirm.ask("[bright_blue]Postgres: Do you want to select a version?[/bright_blue]", default=True):
             answer = prompt([{
                 "type": "list",
@@ -589,18 +694,16 @@ def build_compose_services(settings, nginx_http_port, nginx_https_port, env_file
         pg_service = {
             "image": f"postgres:{pg_version}",
             "restart": "unless-stopped",
-            "volumes": [f"{os.path.join(base_path, 'data', 'nc_postgres')}:/var/lib/postgresql/data:Z"],
+            "volumes": [f"{paths['postgres']}:/var/lib/postgresql/data:Z"],
             "env_file": [env_file],
             "healthcheck": postgres_healthcheck("nextcloud", "${POSTGRES_PASSWORD}")
         }
-        pg_cname = maybe_container_name("postgres", pg_version)
-        if pg_cname:
-            pg_service["container_name"] = pg_cname
+        pg_service["container_name"] = "nextcloud-postgres"
         services["nextcloud-postgres"] = pg_service
 
     # Redis Service
-    if settings["install_redis"]:
-        redis_versions = fetch_semver_versions(REDIS_REPO)
+    if settings.install_redis:
+        redis_versions = version_cache["redis"]
         if Confirm.ask("[bright_blue]Redis: Do you want to select a version?[/bright_blue]", default=True):
             answer = prompt([{
                 "type": "list",
@@ -616,22 +719,20 @@ def build_compose_services(settings, nginx_http_port, nginx_https_port, env_file
         redis_service = {
             "image": f"redis:{redis_version}",
             "restart": "unless-stopped",
-            "volumes": [f"{os.path.join(base_path, 'data', 'nc_redis')}:/data"],
+            "volumes": [f"{paths['redis']}:/data"],
             "env_file": [env_file],
             "command": ["redis-server", "--appendonly", "yes", "--requirepass", "${REDIS_PASS}"]
         }
-        redis_cname = maybe_container_name("redis", redis_version)
-        if redis_cname:
-            redis_service["container_name"] = redis_cname
+        redis_service["container_name"] = "nextcloud-redis"
         services["nextcloud-redis"] = redis_service
 
     # Nextcloud-FPM Service
-    if settings["install_nextcloud"]:
+    if settings.install_nextcloud:
+        fpm_tags = version_cache["nextcloud"]
         if Confirm.ask("[bright_blue]Nextcloud-FPM: Do you want to select a version from the suggestions?[/bright_blue]", default=True):
-            fpm_tags = fetch_nextcloud_fpm_versions()
             if not fpm_tags:
-                console.print("[bright_red]No valid versions found – aborting update.[/bright_red]")
-                settings["nc_fpm_version"] = "unknown"
+                error_console.print("[bright_red]No valid versions found – aborting update.[/bright_red]")
+                settings.nc_fpm_version = "unknown"
             else:
                 answer = prompt([{
                     "type": "list",
@@ -640,34 +741,31 @@ def build_compose_services(settings, nginx_http_port, nginx_https_port, env_file
                     "choices": fpm_tags,
                     "default": fpm_tags[0]
                 }])
-                settings["nc_fpm_version"] = answer["chosen"]
+                settings.nc_fpm_version = answer["chosen"]
         else:
-            default_version = fetch_nextcloud_fpm_versions()
-            settings["nc_fpm_version"] = default_version[0] if default_version else "unknown"
+            settings.nc_fpm_version = fpm_tags[0] if fpm_tags else "unknown"
         nc_service = {
-            "image": f"nextcloud:{settings['nc_fpm_version']}",
+            "image": f"nextcloud:{settings.nc_fpm_version}",
             "restart": "unless-stopped",
             "env_file": [env_file],
             "volumes": [
-                f"{os.path.join(base_path, 'data', 'nc_html')}:/var/www/html:z",
-                f"{os.path.join(base_path, 'data', 'nc_config')}:/var/www/html/config:z",
-                f"{os.path.join(base_path, 'data', 'nc_custom_apps')}:/var/www/html/custom_apps:z",
-                f"{os.path.join(base_path, 'data', 'nc_data')}:/var/www/html/data:z"
+                f"{paths['html']}:/var/www/html:z",
+                f"{paths['config']}:/var/www/html/config:z",
+                f"{paths['custom_apps']}:/var/www/html/custom_apps:z",
+                f"{paths['data']}:/var/www/html/data:z"
             ],
             "depends_on": {}
         }
-        if settings["install_postgres"]:
+        if settings.install_postgres:
             nc_service["depends_on"]["nextcloud-postgres"] = {"condition": "service_healthy"}
-        if settings["install_redis"]:
+        if settings.install_redis:
             nc_service["depends_on"]["nextcloud-redis"] = {"condition": "service_started"}
-        nc_cname = maybe_container_name("nextcloud-fpm", settings["nc_fpm_version"])
-        if nc_cname:
-            nc_service["container_name"] = nc_cname
+        nc_service["container_name"] = "nextcloud-nextcloud-fpm"
         services["nextcloud-fpm"] = nc_service
 
     # Nginx Service
-    if settings["install_nginx"]:
-        nginx_versions = fetch_semver_versions(NGINX_REPO)
+    if settings.install_nginx:
+        nginx_versions = version_cache["nginx"]
         if Confirm.ask("[bright_blue]Nginx: Do you want to select a version?[/bright_blue]", default=True):
             answer = prompt([{
                 "type": "list",
@@ -684,23 +782,28 @@ def build_compose_services(settings, nginx_http_port, nginx_https_port, env_file
             "restart": "unless-stopped",
             "env_file": [env_file],
             "ports": [f"{nginx_http_port}:80", f"{nginx_https_port}:443"],
-            "volumes": [f"{os.path.join(base_path, 'data', 'nc_html')}:/var/www/html:z"],
-            "image": "ghcr.io/nextcloud-cli/nextcloud-nginx:latest",
+            "volumes": [f"{paths['html']}:/var/www/html:z"],
+            "image": NGINX_IMAGE,
+            # Only built if the image cannot be pulled. An earlier fallback
+            # build on this host (with inline cache metadata) is reused as cache.
+            "build": {
+                "context": os.path.join(base_path, "nextcloud-nginx"),
+                "cache_from": [NGINX_LOCAL_IMAGE],
+                "args": {"BUILDKIT_INLINE_CACHE": "1"},
+            },
             "depends_on": {}
         }
-        if settings["install_nextcloud"]:
+        if settings.install_nextcloud:
             nginx_service["depends_on"]["nextcloud-fpm"] = {"condition": "service_started"}
-        nginx_cname = maybe_container_name("nginx", nginx_version)
-        if nginx_cname:
-            nginx_service["container_name"] = nginx_cname
+        nginx_service["container_name"] = "nextcloud-nginx"
         services["nextcloud-nginx"] = nginx_service
 
     # Cron Service for Nextcloud
     cron_service = {
-        "container_name": maybe_container_name("nextcloud-cron", settings["nc_fpm_version"]),
-        "image": f"nextcloud:{settings['nc_fpm_version']}",
+        "container_name": "nextcloud-nextcloud-cron",
+        "image": f"nextcloud:{settings.nc_fpm_version}",
         "restart": "always",
-        "volumes": [f"{os.path.join(base_path, 'data', 'nc_html')}:/var/www/html:z"],
+        "volumes": [f"{paths['html']}:/var/www/html:z"],
         "entrypoint": "/cron.sh",
         "depends_on": {
             "nextcloud-postgres": {"condition": "service_healthy"},
@@ -724,121 +827,285 @@ def run_installation(base_path):
     """
     console.print("[bright_blue]🚀 Nextcloud-FPM Installation started[/bright_blue]\n")
     settings = prompt_installation_settings()
+    version_cache = prefetch_all_versions(settings)
     nginx_http_port, nginx_https_port = prompt_nginx_ports()
     setup_nginx_build_folder(base_path)
     env_file = os.path.join(base_path, "nextcloud.env")
     console.print("[bright_blue]Creating docker-compose.yml...[/bright_blue]")
-    compose_data = build_compose_services(settings, nginx_http_port, nginx_https_port, env_file, base_path)
+    compose_data = build_compose_services(settings, version_cache, nginx_http_port, nginx_https_port, env_file, base_path)
     create_local_directories(base_path)
     write_compose_file(compose_data, base_path)
     create_env_file(
         env_file,
-        settings["postgres_password"],
-        settings["nextcloud_db_user"],
-        settings["nextcloud_db_pass"],
-        settings["redis_pass"],
-        settings["nc_admin_user"],
-        settings["nc_admin_pass"]
+        settings.postgres_password,
+        settings.nextcloud_db_user,
+        settings.nextcloud_db_pass,
+        settings.redis_pass,
+        settings.nc_admin_user,
+        settings.nc_admin_pass
     )
     compose_file = os.path.join(base_path, "docker-compose.yml")
     if Confirm.ask("\n[bright_blue]Do you want to start the containers now?[/bright_blue]", default=True):
         console.print("[bright_blue]Starting containers...[/bright_blue]")
+        # Use BuildKit so a fallback Nginx build can reuse an earlier local build.
+        env = {**os.environ, "DOCKER_BUILDKIT": "1", "COMPOSE_DOCKER_CLI_BUILD": "1"}
+        if settings.install_nginx:
+            pulled = subprocess.run(["docker", "pull", NGINX_IMAGE],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+            if pulled.returncode != 0:
+                # The template build is not the published image, so it must not
+                # run under the published name.
+                console.print(f"[bright_yellow]Could not pull {NGINX_IMAGE}; building Nginx from the template as {NGINX_LOCAL_IMAGE} instead.[/bright_yellow]")
+                compose_data["services"]["nextcloud-nginx"]["image"] = NGINX_LOCAL_IMAGE
+                try:
+                    save_compose_file(compose_data, compose_file)
+                except Exception as e:
+                    error_console.print(f"[bright_red]Error updating docker-compose file: {e}[/bright_red]")
+                    return
         try:
-            subprocess.run(["docker-compose", "-f", compose_file, "up", "-d"],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+            _run(["docker-compose", "-f", compose_file, "up", "-d"], "Starting containers", base_path, env=env)
         except subprocess.CalledProcessError as err:
-            console.print(f"[bright_red]Failed to start containers. Error: {err}[/bright_red]")
+            error_console.print(f"[bright_red]Failed to start containers. Error: {err}[/bright_red]")
             return
         console.print("\n[bright_green]🚀 Containers started successfully![/bright_green]\n")
-    console.print(f"[bright_green]Nextcloud Admin URL:[/bright_green] http://localhost:{nginx_http_port}")
-    console.print(f"[bright_green]Nextcloud Admin User:[/bright_green] {settings['nc_admin_user']}")
-    console.print(f"[bright_green]Nextcloud Admin Password:[/bright_green] {settings['nc_admin_pass']}")
+    # The generated credentials are shown nowhere else, so --quiet must not hide them.
+    error_console.print(f"[bright_green]Nextcloud Admin URL:[/bright_green] http://localhost:{nginx_http_port}")
+    error_console.print(f"[bright_green]Nextcloud Admin User:[/bright_green] {settings.nc_admin_user}")
+    error_console.print(f"[bright_green]Nextcloud Admin Password:[/bright_green] {settings.nc_admin_pass}")
     console.print("\n[bright_blue]Thank you for using Netzint CLI![/bright_blue]")
 
 # ─── Update Process ───────────────────────────────────────────────
 
-def detect_version(service_substring):
+_docker_client = None
+
+def _get_docker_client():
+    """Returns the shared Docker SDK client, creating it on first use."""
+    global _docker_client
+    if _docker_client is None:
+        import docker
+        _docker_client = docker.from_env()
+    return _docker_client
+
+def list_containers():
+    """Returns the running containers keyed by name, using a single Docker API call."""
+    return {container.name: container for container in _get_docker_client().containers.list()}
+
+def _match_container(service_substring, containers=None):
+    """
+    Returns the first running container whose name contains the given substring,
+    or None. containers may be the result of list_containers() to reuse an
+    earlier listing.
+    """
+    if containers is None:
+        containers = list_containers()
+    for name, container in containers.items():
+        if service_substring in name:
+            return container
+    return None
+
+def find_container(service_substring, containers=None):
+    """
+    Returns (container_id, version) of the first running container whose name
+    contains the given substring, or (None, "unknown") if there is none.
+    containers may be the result of list_containers() to reuse an earlier listing.
+    """
+    container = _match_container(service_substring, containers)
+    if container is None:
+        return None, "unknown"
+    return container.id, container.attrs["Config"]["Image"].split(":")[-1]
+
+def detect_version(service_substring, containers=None):
     """
     Detects the version of the running Nextcloud Docker image based on a substring
     in the container name (e.g., "nextcloud-fpm").
     """
-    client = docker.from_env()
     try:
-        for container in client.containers.list():
-            if service_substring in container.name:
-                image = container.attrs["Config"]["Image"]
-                version = image.split(":")[-1]
-                console.print(f"[bright_green]Version for '{service_substring}': {version}[/bright_green]")
-                return version
-        console.print(f"[bright_red]Container with '{service_substring}' not found![/bright_red]")
+        container_id, version = find_container(service_substring, containers)
+        if container_id is not None:
+            console.print(f"[bright_green]Version for '{service_substring}': {version}[/bright_green]")
+            return version
+        error_console.print(f"[bright_red]Container with '{service_substring}' not found![/bright_red]")
         return "unknown"
     except Exception as e:
-        console.print(f"[bright_red]Error detecting version: {e}[/bright_red]")
+        error_console.print(f"[bright_red]Error detecting version: {e}[/bright_red]")
         return "unknown"
 
-def update_docker_compose_images(new_version, service, base_path):
+def _image_with_tag(image, tag):
+    """Returns the image reference with its tag replaced (or added) by tag."""
+    name, sep, _ = image.rpartition(":")
+    if not sep or "/" in image[len(name):]:
+        name = image  # The colon belongs to a registry port, there is no tag
+    return f"{name}:{tag}"
+
+def _start_image_pull(image_ref):
+    """Starts "docker pull image_ref" in a background thread and returns the thread."""
+    thread = threading.Thread(
+        target=subprocess.run,
+        args=(["docker", "pull", image_ref],),
+        kwargs={"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL},
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+def runs_image(image_ref, service_substring):
     """
-    Updates the image for the specified service (e.g., nextcloud-fpm or nextcloud-cron)
-    in the docker-compose.yml (located in the base path) to new_version.
+    Pulls image_ref and returns True if the running container whose name contains
+    service_substring already uses exactly that image (same image ID).
+    Any error counts as a mismatch, so the caller performs the update.
+    """
+    try:
+        client = _get_docker_client()
+        repository, _, tag = image_ref.rpartition(":")
+        pulled = client.images.pull(repository, tag=tag)
+        container = _match_container(service_substring)
+        return container is not None and container.attrs["Image"] == pulled.id
+    except Exception:
+        return False
+
+def load_compose_file(compose_file):
+    """Reads and parses the docker-compose file."""
+    import yaml
+    with open(compose_file, "r") as file:
+        return yaml.load(file, Loader=_yaml_loader())
+
+def _set_image(compose_data, service, version):
+    """Sets the image tag of a service in the parsed compose data (in memory only)."""
+    services = compose_data.get("services", {})
+    if service in services:
+        services[service]["image"] = _image_with_tag(services[service].get("image", "nextcloud"), version)
+
+def save_compose_file(compose_data, compose_file):
+    """Writes the parsed compose data back to the docker-compose file (atomically)."""
+    import yaml
+    tmp_file = f"{compose_file}.tmp"
+    with open(tmp_file, "w") as file:
+        yaml.dump(compose_data, file, Dumper=_yaml_dumper(), default_flow_style=False, sort_keys=False)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_file, compose_file)
+
+def update_docker_compose_images(compose_data, compose_file, updates):
+    """
+    Updates the image tags of several services in the already loaded compose data
+    and writes the docker-compose file once. updates maps service names
+    (e.g., nextcloud-fpm and nextcloud-cron) to their new versions.
     """
-    compose_file = os.path.join(base_path, "docker-compose.yml")
     try:
-        with open(compose_file, "r") as file:
-            compose_data = yaml.safe_load(file)
-        if service in compose_data.get("services", {}):
-            compose_data["services"][service]["image"] = f"nextcloud:{new_version}"
-        with open(compose_file, "w") as file:
-            yaml.dump(compose_data, file, default_flow_style=False)
-        console.print(f"[bright_green]{service} updated to version {new_version} in docker-compose file.[/bright_green]")
+        for service, new_version in updates.items():
+            _set_image(compose_data, service, new_version)
+        save_compose_file(compose_data, compose_file)
+        for service, new_version in updates.items():
+            console.print(f"[bright_green]{service} updated to version {new_version} in docker-compose file.[/bright_green]")
     except Exception as e:
-        console.print(f"[bright_red]Error updating docker-compose file for {service}: {e}[/bright_red]")
+        error_console.print(f"[bright_red]Error updating docker-compose file for {', '.join(updates)}: {e}[/bright_red]")
+
+_status_session = None
+
+def _get_status_session():
+    """Returns the keep-alive session used to poll the local Nextcloud status."""
+    global _status_session
+    if _status_session is None:
+        import requests
+        import urllib3
+        from requests.adapters import HTTPAdapter
+        # The local probe uses a self-signed certificate.
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        session.verify = False
+        _status_session = session
+    return _status_session
 
 def wait_for_nextcloud_status():
     """
     Periodically checks Nextcloud status via HTTP and waits until Nextcloud is ready.
+    Probes start 2s apart and back off exponentially up to 30s.
     The raw status output is not displayed.
     """
-    status_ready = False
     console.print("[bright_blue]Waiting for Nextcloud to be ready...[/bright_blue]")
-    while not status_ready:
+    delay = 2
+    while True:
         try:
-            resp = requests.get("https://localhost/status.php", timeout=10, verify=False)
-            if ('"installed":true' in resp.text and
-                '"maintenance":false' in resp.text and
-                '"needsDbUpgrade":false' in resp.text):
-                status_ready = True
-            else:
-                time.sleep(30)
+            resp = _get_status_session().get("https://localhost/status.php", timeout=(3, 10))
+            # Error pages (e.g. 502 while PHP-FPM starts) are not parsed at all;
+            # the raw bytes go straight to the C JSON decoder without a text decode.
+            if resp.status_code == 200:
+                data = json.loads(resp.content)
+                if data.get("installed") and not data.get("maintenance") and not data.get("needsDbUpgrade"):
+                    return
+        except Exception:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 1.5, 30)
+
+def _occ(container_id, *args):
+    """
+    Runs a Nextcloud OCC command inside the container through the Docker SDK
+    (no docker CLI process, no TTY, no stdin) and returns its output.
+    Raises subprocess.CalledProcessError if the command fails.
+    """
+    container = _get_docker_client().containers.get(container_id)
+    cmd = ["php", "occ", *args]
+    exit_code, output = container.exec_run(cmd, user="www-data", tty=False, stdin=False)
+    output = output.decode(errors="replace")
+    if exit_code != 0:
+        raise subprocess.CalledProcessError(exit_code, cmd, output=output)
+    return output
+
+def _wait_for_occ_ready(container_id, max_wait=OCC_READY_TIMEOUT):
+    """
+    Polls "occ status" until Nextcloud reports "installed: true" and is not in
+    maintenance mode. Probes start 2s apart and back off up to 10s.
+    Returns False if Nextcloud is not ready after max_wait seconds.
+    """
+    deadline = time.monotonic() + max_wait
+    delay = 2
+    while True:
+        try:
+            output = _occ(container_id, "status")
+            if "installed: true" in output and "maintenance: true" not in output:
+                return True
         except Exception:
-            time.sleep(30)
+            pass
+        if time.monotonic() + delay > deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 10)
 
-def run_occ_commands(container_id):
-    """Runs Nextcloud OCC commands inside the container."""
+def run_occ_commands(container_id, base_path):
+    """
+    Runs Nextcloud OCC commands inside the container.
+    Before each follow-up command, waits until Nextcloud reports it is ready again.
+    The output of a failed command is written to the log file in the base path.
+    """
+    commands = [
+        ["db:add-missing-indices"],
+        ["maintenance:repair", "--include-expensive"],
+        ["upgrade"],
+    ]
     try:
-        subprocess.run(["docker", "exec", "--user", "www-data", "-it", container_id, "php", "occ", "db:add-missing-indices"],
-                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-        time.sleep(60)
-        subprocess.run(["docker", "exec", "--user", "www-data", "-it", container_id, "php", "occ", "maintenance:repair", "--include-expensive"],
-                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-        time.sleep(60)
-        subprocess.run(["docker", "exec", "--user", "www-data", "-it", container_id, "php", "occ", "upgrade"],
-                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        for i, args in enumerate(commands):
+            if i > 0 and not _wait_for_occ_ready(container_id):
+                console.print("[bright_yellow]Nextcloud did not report ready in time, continuing anyway.[/bright_yellow]")
+            _occ(container_id, *args)
     except subprocess.CalledProcessError as err:
-        console.print(f"[bright_red]Error running OCC commands: {err}[/bright_red]")
+        _log_failure(err, f"OCC {err.cmd[2]}", base_path)
+        error_console.print(f"[bright_red]Error running OCC commands: {err}[/bright_red]")
+    except Exception as err:
+        error_console.print(f"[bright_red]Error running OCC commands: {err}[/bright_red]")
 
-def get_container_id(service_substring):
+def get_container_id(service_substring, containers=None):
     """
     Returns the container ID for a container whose name contains the given substring.
     """
-    client = docker.from_env()
     try:
-        for container in client.containers.list():
-            if service_substring in container.name:
-                return container.id
-        console.print(f"[bright_red]Container with '{service_substring}' not found![/bright_red]")
-        return None
+        container_id, _ = find_container(service_substring, containers)
+        if container_id is None:
+            error_console.print(f"[bright_red]Container with '{service_substring}' not found![/bright_red]")
+        return container_id
     except Exception as e:
-        console.print(f"[bright_red]Error retrieving container ID: {e}[/bright_red]")
+        error_console.print(f"[bright_red]Error retrieving container ID: {e}[/bright_red]")
         return None
 
 def run_update_process(base_path):
@@ -850,15 +1117,21 @@ def run_update_process(base_path):
          Note: Even when updating to a specific version, major upgrades are applied sequentially.
       4. Performs the update step-by-step with clear messages.
     """
+    from InquirerPy import prompt
+    from packaging.version import Version
     installed_version = detect_version("nextcloud-fpm")
+    if installed_version == "unknown":
+        # detect_version already reported why; there is nothing to compare against.
+        return
     available_versions = fetch_nextcloud_fpm_versions()
-    update_path = []
     try:
-        for version in available_versions:
-            if Version(version.replace("-fpm", "")) > Version(installed_version.replace("-fpm", "")):
-                update_path.append(version)
+        installed = Version(installed_version.replace("-fpm", ""))
+        # Parse each candidate once; the (Version, tag) pairs sort by version,
+        # ascending, so the update proceeds major by major.
+        parsed = [(Version(v.replace("-fpm", "")), v) for v in available_versions]
+        update_path = sorted(pair for pair in parsed if pair[0] > installed)
     except Exception as e:
-        console.print(f"[bright_red]Error comparing versions: {e}[/bright_red]")
+        error_console.print(f"[bright_red]Error comparing versions: {e}[/bright_red]")
         return
 
     if not update_path:
@@ -879,97 +1152,173 @@ def run_update_process(base_path):
             "type": "list",
             "name": "target",
             "message": "Select the target version for Nextcloud update:",
-            "choices": update_path,
-            "default": update_path[-1]
+            "choices": [v for _, v in reversed(update_path)],
+            "default": update_path[0][1]
         }])
         target_version = answer["target"]
         # Filter update_path to only include versions up to the target
-        update_path = [v for v in update_path if Version(v.replace("-fpm", "")) <= Version(target_version.replace("-fpm", ""))]
+        target = Version(target_version.replace("-fpm", ""))
+        update_path = [(pv, v) for pv, v in update_path if pv <= target]
         console.print(f"[bright_blue]Update will proceed sequentially up to version {target_version}.[/bright_blue]")
     else:
         console.print("[bright_blue]Update will proceed sequentially up to the latest version.[/bright_blue]")
 
-    # Sort the update path in ascending order (major-by-major update)
-    update_path = sorted(update_path, key=lambda v: Version(v.replace("-fpm", "")))
     total_steps = len(update_path)
     if total_steps == 0:
         console.print("[bright_green]No update steps are required.[/bright_green]")
         return
 
     compose_file = os.path.join(base_path, "docker-compose.yml")
+    try:
+        # Parsed once; every step changes it in memory and writes it back.
+        compose_data = load_compose_file(compose_file)
+    except Exception as e:
+        error_console.print(f"[bright_red]Error reading docker-compose file: {e}[/bright_red]")
+        return
     step_counter = 1
-    for next_version in update_path:
+    prefetch = None  # Background pull of the image for the following step
+    for i, (_, next_version) in enumerate(update_path):
         console.rule(f"Update Step {step_counter} of {total_steps}: Upgrading to version {next_version}")
-        print("[bright_blue]Stopping containers...[/bright_blue]")
+        if prefetch is not None:
+            prefetch.join()  # The pull below and "up -d" then find the image locally
+            prefetch = None
+        console.print(f"[bright_blue]Pulling nextcloud:{next_version}...[/bright_blue]")
+        if runs_image(f"nextcloud:{next_version}", "nextcloud-fpm"):
+            # Same image digest under another tag: only the compose file changes.
+            update_docker_compose_images(compose_data, compose_file, {"nextcloud-fpm": next_version, "nextcloud-cron": next_version})
+            console.print(f"[bright_green]Already on {next_version}, skipping.[/bright_green]")
+            # No prefetch here: the next step pulls its image right away anyway.
+            step_counter += 1
+            continue
+        console.print("[bright_blue]Stopping containers...[/bright_blue]")
         try:
-            subprocess.run(["docker", "compose", "down"],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+            _run(["docker", "compose", "down"], "Stopping containers", base_path)
         except subprocess.CalledProcessError as err:
-            console.print(f"[bright_red]Failed to stop containers: {err}[/bright_red]")
+            error_console.print(f"[bright_red]Failed to stop containers: {err}[/bright_red]")
             return
-        time.sleep(30)
-        update_docker_compose_images(next_version, "nextcloud-fpm", base_path)
-        update_docker_compose_images(next_version, "nextcloud-cron", base_path)
-        print("[bright_blue]Starting containers...[/bright_blue]")
+        update_docker_compose_images(compose_data, compose_file, {"nextcloud-fpm": next_version, "nextcloud-cron": next_version})
+        console.print("[bright_blue]Starting containers...[/bright_blue]")
         try:
-            subprocess.run(["docker", "compose", "up", "-d"],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+            _run(["docker", "compose", "up", "-d"], "Starting containers", base_path)
         except subprocess.CalledProcessError as err:
-            console.print(f"[bright_red]Failed to start containers: {err}[/bright_red]")
+            error_console.print(f"[bright_red]Failed to start containers: {err}[/bright_red]")
             return
-        time.sleep(60)
+        # The status probe already waits for Nextcloud to come up.
         wait_for_nextcloud_status()
+        if i + 1 < len(update_path):
+            # Pull the next image while the OCC commands of this step run.
+            prefetch = _start_image_pull(f"nextcloud:{update_path[i + 1][1]}")
         container_id = get_container_id("nextcloud-fpm")
         if container_id is not None:
-            run_occ_commands(container_id)
+            run_occ_commands(container_id, base_path)
         else:
-            console.print("[bright_red]Nextcloud-FPM container not found![/bright_red]")
+            error_console.print("[bright_red]Nextcloud-FPM container not found![/bright_red]")
         console.print(f"[bright_green]Update step {step_counter} completed: Nextcloud upgraded to version {next_version}.[/bright_green]")
         step_counter += 1
 
-def update_additional_container(service_key, docker_repo, base_path):
+def update_additional_container(service_key, versions, compose_data, containers=None):
     """
-    Updates an additional container (e.g., Postgres, Redis, or Nginx):
+    Prepares the update of an additional container (e.g., Postgres, Redis, or Nginx):
       - Detects the currently installed version (based on the container name, e.g., "nextcloud-postgres")
-      - Fetches the latest available version from Docker Hub
-      - Asks if an update should be performed and then updates the service separately.
+      - Compares it with the latest version from the given Docker Hub version list
+      - Asks if an update should be performed and, if so, sets the new image in compose_data.
+    Returns the new version if the service should be restarted, otherwise None.
+    The caller writes compose_data back to the docker-compose file.
     """
-    current = detect_version(f"nextcloud-{service_key}")
-    versions = fetch_semver_versions(docker_repo)
+    from packaging.version import Version, InvalidVersion
+    current = detect_version(f"nextcloud-{service_key}", containers)
     if not versions:
-        console.print(f"[bright_red]No valid versions found for {service_key}.[/bright_red]")
-        return
+        error_console.print(f"[bright_red]No valid versions found for {service_key}.[/bright_red]")
+        return None
     latest_version = versions[0]
-    if Version(latest_version) <= Version(current):
+    try:
+        up_to_date = Version(latest_version) <= Version(current)
+    except InvalidVersion:
+        # E.g. "latest" (published Nginx image) or "unknown" (no container).
+        error_console.print(f"[bright_red]Cannot compare {service_key.capitalize()} version '{current}' with {latest_version}, skipping.[/bright_red]")
+        return None
+    if up_to_date:
         console.print(f"[bright_green]{service_key.capitalize()} is already up-to-date (version {current}).[/bright_green]")
-        return
+        return None
     if Confirm.ask(f"[bright_blue]Do you want to update {service_key.capitalize()} from version {current} to {latest_version}?[/bright_blue]", default=True):
-        compose_file = os.path.join(base_path, "docker-compose.yml")
+        _set_image(compose_data, f"nextcloud-{service_key}", latest_version)
+        return latest_version
+    return None
+
+def restart_additional_container(service_key, base_path):
+    """
+    Recreates a single additional container from the docker-compose file.
+    Dependencies are left alone (--no-deps), so several services can be
+    restarted at the same time.
+    """
+    compose_file = os.path.join(base_path, "docker-compose.yml")
+    _run(["docker-compose", "-f", compose_file, "up", "-d", "--no-deps", f"nextcloud-{service_key}"],
+         f"Updating {service_key}", base_path)
+
+def update_additional_containers(base_path):
+    """
+    Updates the additional containers (Postgres, Redis, Nginx):
+    their versions are fetched in parallel, the questions are asked one by one,
+    the docker-compose file is written once and the confirmed containers are
+    restarted in parallel.
+    """
+    compose_file = os.path.join(base_path, "docker-compose.yml")
+    try:
+        compose_data = load_compose_file(compose_file)
+    except Exception as e:
+        error_console.print(f"[bright_red]Error reading docker-compose file: {e}[/bright_red]")
+        return
+    additional = [("postgres", POSTGRES_REPO), ("redis", REDIS_REPO), ("nginx", NGINX_REPO)]
+    with ThreadPoolExecutor(max_workers=len(additional)) as executor:
+        version_futures = [executor.submit(fetch_semver_versions, repo) for _, repo in additional]
+        # One container listing serves all three version checks.
         try:
-            update_docker_compose_images(latest_version, f"nextcloud-{service_key}", base_path)
-            subprocess.run(["docker-compose", "-f", compose_file, "up", "-d", f"nextcloud-{service_key}"],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-            console.print(f"[bright_green]{service_key.capitalize()} updated successfully to version {latest_version}.[/bright_green]")
-        except subprocess.CalledProcessError as err:
-            console.print(f"[bright_red]Failed to update {service_key.capitalize()}: {err}[/bright_red]")
+            containers = list_containers()
+        except Exception:
+            containers = None  # Each check retries and reports the error itself
+        updates = {}
+        for (service_key, _), future in zip(additional, version_futures):
+            new_version = update_additional_container(service_key, future.result(), compose_data, containers)
+            if new_version is not None:
+                updates[service_key] = new_version
+        if updates:
+            update_docker_compose_images(
+                compose_data, compose_file,
+                {f"nextcloud-{service_key}": version for service_key, version in updates.items()},
+            )
+        restarts = {
+            service_key: executor.submit(restart_additional_container, service_key, base_path)
+            for service_key in updates
+        }
+        for service_key, future in restarts.items():
+            try:
+                future.result()
+                console.print(f"[bright_green]{service_key.capitalize()} updated successfully to version {updates[service_key]}.[/bright_green]")
+            except subprocess.CalledProcessError as err:
+                error_console.print(f"[bright_red]Failed to update {service_key.capitalize()}: {err}[/bright_red]")
 
 def run_update(base_path):
     """
     Main function for the update process:
       1. First updates Nextcloud (as above).
-      2. Then asks if additional containers (Postgres, Redis, Nginx) should be updated.
+      2. Then asks if additional containers (Postgres, Redis, Nginx) should be updated
+         (see update_additional_containers).
     """
     console.print("[bright_blue]🚀 Nextcloud Update Process started[/bright_blue]\n")
     run_update_process(base_path)
     if Confirm.ask("[bright_blue]Do you also want to update the additional containers (Postgres, Redis, Nginx)?[/bright_blue]", default=False):
-        update_additional_container("postgres", POSTGRES_REPO, base_path)
-        update_additional_container("redis", REDIS_REPO, base_path)
-        update_additional_container("nginx", NGINX_REPO, base_path)
+        update_additional_containers(base_path)
     console.print("\n[bright_blue]Update process completed. Thank you![/bright_blue]")
 
 # ─── Main ───────────────────────────────────────────────────────
 
-def main():
+@click.command()
+@click.option("--refresh-tags", is_flag=True, help="Ignore cached Docker Hub tags and fetch them again.")
+@click.option("--quiet", is_flag=True, help="Suppress status output; errors, admin credentials (on stderr) and interactive prompts are still shown.")
+def main(refresh_tags, quiet):
+    global _refresh_tags
+    _refresh_tags = refresh_tags
+    console.quiet = quiet
     service, action, base_path = start_menu()
     if service != "Nextcloud":
         console.print("[bright_yellow]Moodle functionality is not yet implemented.[/bright_yellow]")